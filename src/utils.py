@@ -3,29 +3,47 @@
 
 """A collection of utility functions that are used in the charm."""
 
-import hashlib
 import secrets
 import string
 
+_PASSWORD_ALPHABET = (string.ascii_letters + string.digits).encode("ascii")
+
+# Reject bytes >= 248 (the largest multiple of 62 that fits in a byte) so that
+# mapping a byte into the 62-character alphabet with modulo stays unbiased
+_REJECTION_THRESHOLD = 256 - (256 % len(_PASSWORD_ALPHABET))
+
 
 def generate_random_password(length: int) -> str:
     """Randomly generate a string intended to be used as a password.
 
+    Draws entropy in bulk with `secrets.token_bytes` instead of calling
+    `secrets.choice` once per character.
+
     Args:
         length: length of the randomly generated string to be returned
 
     Returns:
         a string with random letters and digits of length specified
     """
-    choices = string.ascii_letters + string.digits
-    return "".join([secrets.choice(choices) for i in range(length)])
+    password = bytearray()
+
+    while len(password) < length:
+        # oversample to make a second round of sampling unlikely
+        for byte in secrets.token_bytes((length - len(password)) * 2):
+            if byte >= _REJECTION_THRESHOLD:
+                continue
+
+            password.append(_PASSWORD_ALPHABET[byte % len(_PASSWORD_ALPHABET)])
+            if len(password) == length:
+                break
+
+    return password.decode("ascii")
 
 
 def generate_random_hash() -> str:
     """Generate a random hash.
 
     Returns:
-        A random MD5 hash
+        A random 32 character hexadecimal string
     """
-    random_characters = generate_random_password(20)
-    return hashlib.md5(random_characters.encode("utf-8")).hexdigest()
+    return secrets.token_hex(16)
@@ -0,0 +1,19 @@
+# Copyright 2022 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Cached access to the charm metadata for the integration tests."""
+
+import functools
+from pathlib import Path
+
+import yaml
+
+
+@functools.lru_cache(maxsize=1)
+def get_metadata() -> dict:
+    """Parse metadata.yaml once and reuse the result across test modules.
+
+    Returns:
+        The parsed contents of the charm's metadata.yaml
+    """
+    return yaml.safe_load(Path("./metadata.yaml").read_text())
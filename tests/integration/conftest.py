@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+# Copyright 2022 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import pytest
+
+from tests.integration.connector import close_connection_pools
+
+
+@pytest.fixture(scope="session", autouse=True)
+def connection_pools():
+    """Closes the pooled MySQL connections once the test session ends."""
+    yield
+    close_connection_pools()
@@ -2,13 +2,50 @@
 # Copyright 2022 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+import hashlib
+from typing import Dict, FrozenSet
+
 import mysql.connector
+import mysql.connector.pooling
+
+# Connection pools keyed by the full connector config, so calls that vary any
+# option (ssl_disabled, rotated passwords, timeouts, ...) never reuse a pool
+# built with different settings; pooling amortizes the TCP/TLS/auth handshake
+# over the many short query batches the integration tests issue
+_pools: Dict[FrozenSet, mysql.connector.pooling.MySQLConnectionPool] = {}
+
+
+def _get_pool(config: dict) -> mysql.connector.pooling.MySQLConnectionPool:
+    """Return the connection pool for a config, creating it on first use.
+
+    Args:
+        config: Configuration dict for the mysql connector
+    """
+    key = frozenset(config.items())
+    if key not in _pools:
+        # pool names are restricted to alphanumerics and ._-*$#, so derive
+        # one from a digest of the config
+        digest = hashlib.blake2b(repr(sorted(config.items())).encode(), digest_size=8)
+        _pools[key] = mysql.connector.pooling.MySQLConnectionPool(
+            pool_name=f"pool-{digest.hexdigest()}",
+            pool_size=4,
+            **config,
+        )
+    return _pools[key]
+
+
+def close_connection_pools() -> None:
+    """Close all pooled connections, e.g. at test session teardown."""
+    for pool in _pools.values():
+        # there is no public API to drain a pool
+        pool._remove_connections()
+    _pools.clear()
 
 
 class MysqlConnector:
     """Context manager for mysql connector."""
 
-    def __init__(self, config: dict, commit: bool = True):
+    def __init__(self, config: dict, commit: bool = True, pooled: bool = True):
         """Initialize the context manager.
 
         Args:
@@ -21,19 +58,42 @@ class MysqlConnector:
                     "raise_on_warnings": False,
                 }
             commit: Commit the transaction after the context is exited.
+            pooled: Draw the connection from a shared pool instead of opening
+                a fresh one (disable to test whether a new connection is
+                currently possible).
         """
         self.config = config
         self.commit = commit
+        self.pooled = pooled
 
     def __enter__(self):
-        """Create the connection and return a cursor."""
-        self.connection = mysql.connector.connect(**self.config)
+        """Create or acquire the connection and return a cursor."""
+        if not self.pooled:
+            self.connection = mysql.connector.connect(**self.config)
+            self.cursor = self.connection.cursor()
+            return self.cursor
+
+        self.connection = _get_pool(self.config).get_connection()
+        try:
+            # a pooled connection may have gone stale since its last use
+            self.connection.ping(reconnect=True)
+        except mysql.connector.Error:
+            # return the connection before propagating, so the pool slot is not leaked
+            try:
+                self.connection.close()
+            except mysql.connector.Error:
+                pass
+            raise
         self.cursor = self.connection.cursor()
         return self.cursor
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Handle transaction and connection close."""
-        if self.commit:
-            self.connection.commit()
-        self.cursor.close()
-        self.connection.close()
+        """Handle transaction and close or return the connection."""
+        try:
+            if self.commit:
+                self.connection.commit()
+            self.cursor.close()
+        finally:
+            # always close, even when commit fails on a dead connection, so a
+            # pooled connection is returned and its slot is not leaked
+            self.connection.close()
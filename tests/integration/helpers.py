@@ -4,8 +4,8 @@
 import itertools
 import json
 import logging
+import random
 import re
-import secrets
 import string
 import subprocess
 from typing import Dict, List, Optional, Set
@@ -29,6 +29,20 @@ logger = logging.getLogger(__name__)
 TIMEOUT = 16 * 60
 TIMEOUT_BIG = 25 * 60
 
+_RANDOM_STRING_ALPHABET = string.ascii_letters + string.digits
+
+# Caches of per-unit values that are stable while the cluster topology is, keyed by unit
+# name; resolving either value incurs a Juju round-trip, so they are looked up once and
+# invalidated whenever units are scaled or a unit's network changes
+_unit_ip_cache: Dict[str, str] = {}
+_server_config_credentials_cache: Dict[str, Dict] = {}
+
+
+def clear_unit_caches() -> None:
+    """Clear the cached unit IPs and credentials after a topology change."""
+    _unit_ip_cache.clear()
+    _server_config_credentials_cache.clear()
+
 
 async def run_command_on_unit(unit, command: str) -> Optional[str]:
     """Run a command in one Juju unit.
@@ -48,14 +62,16 @@ async def run_command_on_unit(unit, command: str) -> Optional[str]:
 def generate_random_string(length: int) -> str:
     """Generate a random string of the provided length.
 
+    The generated string is not cryptographically secure and is only intended
+    to produce test data (use `utils.generate_random_password` for secrets).
+
     Args:
         length: the length of the random string to generate
 
     Returns:
         A random string comprised of letters and digits
     """
-    choices = string.ascii_letters + string.digits
-    return "".join([secrets.choice(choices) for i in range(length)])
+    return "".join(random.choices(_RANDOM_STRING_ALPHABET, k=length))
 
 
 async def scale_application(
@@ -77,6 +93,8 @@ async def scale_application(
     if count == count_existing_units:
         return
 
+    clear_unit_caches()
+
     # Scale up
     if count > count_existing_units:
         for _ in range(count - count_existing_units):
@@ -177,10 +195,13 @@ async def get_server_config_credentials(unit: Unit) -> Dict:
     Returns:
         A dictionary with the server config username and password
     """
-    action = await unit.run_action(action_name="get-password", username=SERVER_CONFIG_USERNAME)
-    result = await action.wait()
+    if unit.name not in _server_config_credentials_cache:
+        action = await unit.run_action(action_name="get-password", username=SERVER_CONFIG_USERNAME)
+        result = await action.wait()
 
-    return result.results
+        _server_config_credentials_cache[unit.name] = result.results
+
+    return _server_config_credentials_cache[unit.name]
 
 
 async def fetch_credentials(unit: Unit, username: str = None) -> Dict:
@@ -337,7 +358,8 @@ def is_connection_possible(credentials: Dict, **extra_opts) -> bool:
     }
 
     try:
-        with MysqlConnector(config) as cursor:
+        # bypass pooling: the probe must test whether a fresh connection is possible
+        with MysqlConnector(config, pooled=False) as cursor:
             cursor.execute("SELECT 1")
             return cursor.fetchone()[0] == 1
     except (DatabaseError, InterfaceError, OperationalError, ProgrammingError):
@@ -498,6 +520,9 @@ def wait_network_restore(model_name: str, hostname: str, old_ip: str) -> None:
     if instance_ip(model_name, hostname) == old_ip:
         raise Exception
 
+    # the instance IP changed; drop the unit addresses cached before the network cut
+    clear_unit_caches()
+
 
 async def graceful_stop_server(ops_test: OpsTest, unit_name: str) -> None:
     """Gracefully stop server.
@@ -581,7 +606,12 @@ async def get_unit_ip(ops_test: OpsTest, unit_name: str) -> str:
     Returns:
         The (str) ip of the unit
     """
-    return instance_ip(ops_test.model.info.name, await unit_hostname(ops_test, unit_name))
+    if unit_name not in _unit_ip_cache:
+        _unit_ip_cache[unit_name] = instance_ip(
+            ops_test.model.info.name, await unit_hostname(ops_test, unit_name)
+        )
+
+    return _unit_ip_cache[unit_name]
 
 
 async def get_relation_data(
@@ -679,6 +709,7 @@ async def remove_leader_unit(ops_test: OpsTest, application_name: str):
             leader_unit = app_unit.name
 
     await ops_test.model.destroy_units(leader_unit)
+    clear_unit_caches()
 
     count = len(ops_test.model.applications[application_name].units)
 
@@ -1,16 +1,24 @@
 # Copyright 2022 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+import asyncio
+import hashlib
 import logging
 import subprocess
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
-import yaml
 from juju.unit import Unit
 from pytest_operator.plugin import OpsTest
-from tenacity import RetryError, Retrying, stop_after_delay, wait_fixed
+from tenacity import (
+    RetryError,
+    Retrying,
+    stop_after_delay,
+    wait_exponential,
+    wait_fixed,
+)
 
+from tests.integration._metadata import get_metadata
 from tests.integration.helpers import (
     execute_queries_on_unit,
     generate_random_string,
@@ -19,6 +27,7 @@ from tests.integration.helpers import (
     get_server_config_credentials,
     get_unit_ip,
     is_relation_joined,
+    run_command_on_unit,
     scale_application,
 )
 from tests.integration.integration_constants import (
@@ -31,12 +40,19 @@ DATABASE_NAME = "continuous_writes_database"
 TABLE_NAME = "data"
 
 CLUSTER_NAME = "test_cluster"
-METADATA = yaml.safe_load(Path("./metadata.yaml").read_text())
+METADATA = get_metadata()
 MYSQL_DEFAULT_APP_NAME = METADATA["name"]
 APPLICATION_DEFAULT_APP_NAME = "application"
 TIMEOUT = 20 * 60
 
-mysql_charm, application_charm = None, None
+# Cache of charm artifacts built during the test session: the mysql charm url is
+# stored under "mysql" and the built application charm path under "application"
+_built_charms: Dict[str, str] = {}
+
+# Cache of application names looked up in the model status, keyed by (model, name
+# fragment); the lookup requires fetching the full model status from the controller,
+# so it is done once and the cache is seeded by the deploy_and_scale_* helpers
+_application_name_cache: Dict[Tuple[int, str], str] = {}
 
 logger = logging.getLogger(__name__)
 
@@ -70,15 +86,24 @@ async def get_application_name(ops_test: OpsTest, application_name: str) -> str:
 
     This enables us to retrieve the name of the deployed application in an existing model.
 
+    The result is cached per model, since every lookup otherwise materializes
+    the full model status from the controller.
+
     Note: if multiple applications with the application name exist,
     the first one found will be returned.
     """
+    cache_key = (id(ops_test.model), application_name)
+    if cache_key in _application_name_cache:
+        return _application_name_cache[cache_key]
+
     status = await ops_test.model.get_status()
+    applications_status = status["applications"]
 
     for application in ops_test.model.applications:
         # note that format of the charm field is not exactly "mysql" but instead takes the form
         # of `local:focal/mysql-6`
-        if application_name in status["applications"][application]["charm"]:
+        if application_name in applications_status[application]["charm"]:
+            _application_name_cache[cache_key] = application
             return application
 
     return None
@@ -89,6 +114,10 @@ async def ensure_n_online_mysql_members(
 ) -> bool:
     """Waits until N mysql cluster members are online.
 
+    Probes with exponential backoff (starting below a second, capped at 10s)
+    so a cluster that stabilizes quickly is detected quickly, while a slow one
+    is not hammered with cluster status requests.
+
     Args:
         ops_test: The ops test framework
         number_online_members: Number of online members to wait for
@@ -102,7 +131,9 @@ async def ensure_n_online_mysql_members(
     mysql_unit = mysql_units[0]
 
     try:
-        for attempt in Retrying(stop=stop_after_delay(10 * 60), wait=wait_fixed(10)):
+        for attempt in Retrying(
+            stop=stop_after_delay(10 * 60), wait=wait_exponential(multiplier=0.5, max=10)
+        ):
             with attempt:
                 cluster_status = await get_cluster_status(ops_test, mysql_unit)
                 online_members = [
@@ -118,16 +149,54 @@ async def ensure_n_online_mysql_members(
         return False
 
 
+def _charm_source_hash() -> str:
+    """Hashes the charm source files that determine the packed artifact.
+
+    Returns:
+        A hex digest over the path, mtime and size of every charm source file
+    """
+    hasher = hashlib.sha256()
+
+    source_paths = [
+        Path("actions.yaml"),
+        Path("charmcraft.yaml"),
+        Path("config.yaml"),
+        Path("metadata.yaml"),
+        Path("requirements.txt"),
+        *sorted(Path("src").rglob("*")),
+        *sorted(Path("lib").rglob("*")),
+        *sorted(Path("templates").rglob("*")),
+    ]
+    for path in source_paths:
+        if path.is_file():
+            file_stat = path.stat()
+            hasher.update(f"{path}:{file_stat.st_mtime_ns}:{file_stat.st_size}".encode())
+
+    return hasher.hexdigest()
+
+
 def pack_charm(series: str) -> str:
     """Packs a charm from local source folder, avoiding rebuilds.
 
+    A stamp file containing a hash of the charm source is kept next to the
+    packed charm, so the build is only skipped when the existing artifact is
+    up to date with the source (and stale artifacts are rebuilt).
+
     Args:
         series: charm series
     """
     charm_url = f"local:mysql_ubuntu-{SERIES_TO_VERSION[series]}-amd64.charm"
     charm_path = Path(charm_url.split(":")[1])
-    if charm_path.exists() and charm_path.is_file():
-        logger.info("Skipping build, charm file encountered")
+    stamp_path = Path(f".{charm_path.name}.stamp")
+
+    source_hash = _charm_source_hash()
+    if (
+        charm_path.exists()
+        and charm_path.is_file()
+        and stamp_path.exists()
+        and stamp_path.read_text() == source_hash
+    ):
+        logger.info("Skipping build, charm file up to date")
         return charm_url
 
     # Build and deploy charm from local source folder
@@ -140,9 +209,32 @@ def pack_charm(series: str) -> str:
         f"charmcraft pack --bases-index={SERIES_TO_BASE_INDEX[series]}",
     ]
     subprocess.check_call(charmcraft_pack_commands)
+    stamp_path.write_text(source_hash)
     return charm_url
 
 
+async def build_charms(ops_test: OpsTest, series: str) -> Tuple[str, str]:
+    """Builds the mysql and test application charms, overlapping the two builds.
+
+    Results are cached so that each charm is built at most once per test session.
+
+    Args:
+        ops_test: The ops test framework
+        series: The series to pack the mysql charm for
+    """
+    if "mysql" not in _built_charms or "application" not in _built_charms:
+        # pack_charm shells out synchronously, so run it in an executor to let
+        # the application charm build proceed concurrently
+        mysql_charm_url, application_charm = await asyncio.gather(
+            asyncio.get_running_loop().run_in_executor(None, pack_charm, series),
+            ops_test.build_charm("./tests/integration/high_availability/application_charm/"),
+        )
+        _built_charms["mysql"] = mysql_charm_url
+        _built_charms["application"] = application_charm
+
+    return _built_charms["mysql"], _built_charms["application"]
+
+
 async def deploy_and_scale_mysql(
     ops_test: OpsTest,
     series: str,
@@ -167,7 +259,10 @@ async def deploy_and_scale_mysql(
 
         return application_name
 
-    charm_url = pack_charm(series)
+    charm_url = _built_charms.get("mysql")
+    if not charm_url:
+        charm_url = pack_charm(series)
+        _built_charms["mysql"] = charm_url
 
     config = {"cluster-name": CLUSTER_NAME}
 
@@ -188,6 +283,11 @@ async def deploy_and_scale_mysql(
 
         assert len(ops_test.model.applications[mysql_application_name].units) == 3
 
+    if mysql_application_name == MYSQL_DEFAULT_APP_NAME:
+        # seed the cache so later lookups skip the full-model status fetch; custom
+        # names (e.g. a second cluster) must not shadow the default application
+        _application_name_cache[(id(ops_test.model), "mysql")] = mysql_application_name
+
     return mysql_application_name
 
 
@@ -206,17 +306,17 @@ async def deploy_and_scale_application(ops_test: OpsTest) -> str:
 
         return application_name
 
-    global application_charm
-    if not application_charm:
+    charm = _built_charms.get("application")
+    if not charm:
         charm = await ops_test.build_charm(
             "./tests/integration/high_availability/application_charm/"
         )
         # Cache the built charm to avoid rebuilding it between tests
-        application_charm = charm
+        _built_charms["application"] = charm
 
     async with ops_test.fast_forward():
         await ops_test.model.deploy(
-            application_charm,
+            charm,
             application_name=APPLICATION_DEFAULT_APP_NAME,
             num_units=1,
         )
@@ -230,6 +330,9 @@ async def deploy_and_scale_application(ops_test: OpsTest) -> str:
 
         assert len(ops_test.model.applications[APPLICATION_DEFAULT_APP_NAME].units) == 1
 
+    # seed the cache so later lookups skip the full-model status fetch
+    _application_name_cache[(id(ops_test.model), "application")] = APPLICATION_DEFAULT_APP_NAME
+
     return APPLICATION_DEFAULT_APP_NAME
 
 
@@ -268,6 +371,14 @@ async def high_availability_test_setup(
         ops_test: The ops test framework
         series: Series to run mysql charm (defaults to focal)
     """
+    mysql_application_name = await get_application_name(ops_test, "mysql")
+    application_name = await get_application_name(ops_test, "application")
+
+    if not (mysql_application_name and application_name):
+        # build both charms up front so that the builds overlap, instead of
+        # happening serially inside each deploy helper
+        await build_charms(ops_test, series)
+
     mysql_application_name = await deploy_and_scale_mysql(ops_test, series)
     application_name = await deploy_and_scale_application(ops_test)
 
@@ -276,22 +387,60 @@ async def high_availability_test_setup(
     return mysql_application_name, application_name
 
 
+async def wait_until_units_count(
+    ops_test: OpsTest, application_name: str, count: int, timeout: int = TIMEOUT
+) -> None:
+    """Waits until an application reaches the given number of units.
+
+    Subscribes to the model's delta stream instead of polling the unit count,
+    so the change is observed as soon as the controller reports it and no
+    status round-trips are issued while waiting.
+
+    Args:
+        ops_test: The ops test framework
+        application_name: The name of the application to watch
+        count: The number of units to wait for
+        timeout: Seconds to wait for the unit count before failing
+    """
+    application = ops_test.model.applications[application_name]
+
+    if len(application.units) == count:
+        return
+
+    unit_count_reached = asyncio.Event()
+
+    async def _check_unit_count(delta, old_obj, new_obj, model):
+        if len(application.units) == count:
+            unit_count_reached.set()
+
+    ops_test.model.add_observer(_check_unit_count, entity_type="unit")
+    try:
+        await asyncio.wait_for(unit_count_reached.wait(), timeout)
+    finally:
+        # libjuju has no public API to unsubscribe an observer, so drop it
+        # from the model's observer table to avoid stale callbacks piling up
+        for observer in list(ops_test.model._observers):
+            if getattr(observer, "callable_", None) is _check_unit_count:
+                del ops_test.model._observers[observer]
+
+
 async def get_process_stat(ops_test: OpsTest, unit_name: str, process: str) -> str:
     """Retrieve the STAT column of a process on a unit.
 
+    The command is dispatched through the Juju controller instead of a direct
+    ssh connection, avoiding a per-call ssh handshake.
+
     Args:
         ops_test: The ops test framework
         unit_name: The name of the unit for the process
         process: The name of the process to get the STAT for
     """
-    get_stat_commands = [
-        "ssh",
-        unit_name,
+    stat = await run_command_on_unit(
+        ops_test.model.units[unit_name],
         f"ps -eo comm,stat | grep {process} | awk '{{print $2}}'",
-    ]
-    return_code, stat, _ = await ops_test.juju(*get_stat_commands)
+    )
 
-    assert return_code == 0, f"Failed to get STAT, unit_name={unit_name}, process={process}"
+    assert stat, f"Failed to get STAT, unit_name={unit_name}, process={process}"
 
     return stat
 
@@ -338,19 +487,22 @@ async def insert_data_into_mysql_and_validate_replication(
         f"SELECT id FROM `{database_name}`.`{table_name}` WHERE id = '{value}'",
     ]
 
+    async def _validate_value_on_unit(unit: Unit) -> None:
+        unit_address = await get_unit_ip(ops_test, unit.name)
+
+        output = await execute_queries_on_unit(
+            unit_address,
+            server_config_credentials["username"],
+            server_config_credentials["password"],
+            select_value_sql,
+        )
+        assert output[0] == value
+
     try:
         for attempt in Retrying(stop=stop_after_delay(5 * 60), wait=wait_fixed(10)):
             with attempt:
-                for unit in mysql_units:
-                    unit_address = await get_unit_ip(ops_test, unit.name)
-
-                    output = await execute_queries_on_unit(
-                        unit_address,
-                        server_config_credentials["username"],
-                        server_config_credentials["password"],
-                        select_value_sql,
-                    )
-                    assert output[0] == value
+                # query all units concurrently; a failure on any unit retries them all
+                await asyncio.gather(*(_validate_value_on_unit(unit) for unit in mysql_units))
     except RetryError:
         assert False, "Cannot query inserted data from all units"
 
@@ -413,37 +565,35 @@ async def ensure_all_units_continuous_writes_incrementing(
         ops_test, primary, server_config_credentials
     )
 
-    select_all_continuous_writes_sql = [f"SELECT * FROM `{DATABASE_NAME}`.`{TABLE_NAME}`"]
+    select_writes_summary_sql = [
+        f"SELECT MIN(number), MAX(number), COUNT(number) FROM `{DATABASE_NAME}`.`{TABLE_NAME}`"
+    ]
+
+    async def _check_writes_on_unit(unit: Unit) -> None:
+        # ensure that the unit is up to date (including the previous primary)
+        unit_address = await get_unit_ip(ops_test, unit.name)
+
+        # an aggregate summary detects gaps without transferring the table,
+        # keeping the bytes on the wire constant as the writes accumulate
+        min_written_value, max_written_value, count = await execute_queries_on_unit(
+            unit_address,
+            server_config_credentials["username"],
+            server_config_credentials["password"],
+            select_writes_summary_sql,
+        )
+
+        # ensure the max written value is incrementing (continuous writes is active)
+        assert (
+            max_written_value is not None and max_written_value > last_max_written_value
+        ), f"Continuous writes not incrementing on unit {unit.name}"
+
+        # a gap-free sequence starting at 1 contains exactly max distinct values
+        assert (
+            min_written_value == 1 and max_written_value - min_written_value + 1 == count
+        ), f"Missing writes in database for unit {unit.name}"
 
     async with ops_test.fast_forward():
-        for unit in mysql_units:
-            for attempt in Retrying(
-                reraise=True, stop=stop_after_delay(5 * 60), wait=wait_fixed(10)
-            ):
-                with attempt:
-                    # ensure that all units are up to date (including the previous primary)
-                    unit_address = await get_unit_ip(ops_test, unit.name)
-
-                    # ensure the max written value is incrementing (continuous writes is active)
-                    max_written_value = await get_max_written_value_in_database(
-                        ops_test, unit, server_config_credentials
-                    )
-                    assert (
-                        max_written_value > last_max_written_value
-                    ), "Continuous writes not incrementing"
-
-                    # ensure that the unit contains all values up to the max written value
-                    all_written_values = set(
-                        await execute_queries_on_unit(
-                            unit_address,
-                            server_config_credentials["username"],
-                            server_config_credentials["password"],
-                            select_all_continuous_writes_sql,
-                        )
-                    )
-                    numbers = {n for n in range(1, max_written_value)}
-                    assert (
-                        numbers <= all_written_values
-                    ), f"Missing numbers in database for unit {unit.name}"
-
-                    last_max_written_value = max_written_value
+        for attempt in Retrying(reraise=True, stop=stop_after_delay(5 * 60), wait=wait_fixed(10)):
+            with attempt:
+                # query all units concurrently; a failure on any unit retries them all
+                await asyncio.gather(*(_check_writes_on_unit(unit) for unit in mysql_units))
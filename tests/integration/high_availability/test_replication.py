@@ -3,14 +3,14 @@
 # See LICENSE file for licensing details.
 
 
+import asyncio
 import logging
 import subprocess
-from pathlib import Path
 
 import pytest
-import yaml
 from pytest_operator.plugin import OpsTest
 
+from tests.integration._metadata import get_metadata
 from tests.integration.helpers import (
     app_name,
     cluster_name,
@@ -28,12 +28,13 @@ from tests.integration.high_availability.high_availability_helpers import (
     high_availability_test_setup,
     insert_data_into_mysql_and_validate_replication,
     pack_charm,
+    wait_until_units_count,
 )
 from tests.integration.integration_constants import SERIES_TO_VERSION
 
 logger = logging.getLogger(__name__)
 
-METADATA = yaml.safe_load(Path("./metadata.yaml").read_text())
+METADATA = get_metadata()
 APP_NAME = METADATA["name"]
 ANOTHER_APP_NAME = f"second{APP_NAME}"
 TIMEOUT = 17 * 60
@@ -69,7 +70,6 @@ async def test_consistent_data_replication_across_cluster(
 async def test_kill_primary_check_reelection(ops_test: OpsTest) -> None:
     """Confirm that a new primary is elected when the current primary is torn down."""
     mysql_application_name, _ = await high_availability_test_setup(ops_test)
-    application = ops_test.model.applications[mysql_application_name]
 
     await ensure_all_units_continuous_writes_incrementing(ops_test)
 
@@ -82,7 +82,7 @@ async def test_kill_primary_check_reelection(ops_test: OpsTest) -> None:
     await ops_test.model.destroy_units(primary_unit.name)
 
     async with ops_test.fast_forward():
-        await ops_test.model.block_until(lambda: len(application.units) == 2)
+        await wait_until_units_count(ops_test, mysql_application_name, 2)
         await ops_test.model.wait_for_idle(
             apps=[mysql_application_name],
             status="active",
@@ -157,7 +157,7 @@ async def test_scaling_without_data_loss(ops_test: OpsTest) -> None:
         f"SELECT * FROM test.instance_state_replication WHERE id = '{random_chars}'",
     ]
 
-    for unit in application.units:
+    async def read_data_on_unit(unit):
         unit_address = await unit.get_public_address()
         output = await execute_queries_on_unit(
             unit_address,
@@ -167,10 +167,12 @@ async def test_scaling_without_data_loss(ops_test: OpsTest) -> None:
         )
         assert random_chars in output
 
+    await asyncio.gather(*(read_data_on_unit(unit) for unit in application.units))
+
     # Destroy the recently created unit and wait until the application is active
     await ops_test.model.destroy_units(added_unit.name)
     async with ops_test.fast_forward():
-        await ops_test.model.block_until(lambda: len(ops_test.model.applications[app].units) == 3)
+        await wait_until_units_count(ops_test, app, 3)
         await ops_test.model.wait_for_idle(
             apps=[app],
             status="active",
@@ -179,15 +181,7 @@ async def test_scaling_without_data_loss(ops_test: OpsTest) -> None:
         )
 
     # Ensure that the data still exists in all the units
-    for unit in application.units:
-        unit_address = await unit.get_public_address()
-        output = await execute_queries_on_unit(
-            unit_address,
-            server_config_credentials["username"],
-            server_config_credentials["password"],
-            select_data_sql,
-        )
-        assert random_chars in output
+    await asyncio.gather(*(read_data_on_unit(unit) for unit in application.units))
 
 
 @pytest.mark.ha_tests
@@ -217,9 +211,7 @@ async def test_cluster_isolation(ops_test: OpsTest, series: str) -> None:
         series=series,
     )
     async with ops_test.fast_forward():
-        await ops_test.model.block_until(
-            lambda: len(ops_test.model.applications[ANOTHER_APP_NAME].units) == 1
-        )
+        await wait_until_units_count(ops_test, ANOTHER_APP_NAME, 1)
         await ops_test.model.wait_for_idle(
             apps=[ANOTHER_APP_NAME],
             status="active",
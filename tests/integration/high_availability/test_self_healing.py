@@ -4,14 +4,13 @@
 
 import asyncio
 import logging
-from pathlib import Path
 
 import pytest
-import yaml
 from pytest_operator.plugin import OpsTest
 from tenacity import RetryError, Retrying, stop_after_attempt, wait_fixed
 
 from constants import CLUSTER_ADMIN_USERNAME, SERVER_CONFIG_USERNAME
+from tests.integration._metadata import get_metadata
 from tests.integration.helpers import (
     cut_network_from_unit,
     execute_queries_on_unit,
@@ -41,7 +40,7 @@ from tests.integration.high_availability.high_availability_helpers import (
 
 logger = logging.getLogger(__name__)
 
-METADATA = yaml.safe_load(Path("./metadata.yaml").read_text())
+METADATA = get_metadata()
 APP_NAME = METADATA["name"]
 MYSQL_DAEMON = "mysqld"
 